@@ -7,25 +7,60 @@ This module provides several API classes:
   - PrivateApi: a subclass of class Api that provides methods to interact with private API of an Exonum node.
   - ServiceApi: a class that provides methods to interact with node services.
 """
-from typing import Optional, Any, Union, List, Dict, Iterable
+from typing import Optional, Any, Union, List, Dict, Iterable, Set
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
+from threading import Lock
+from urllib.parse import quote
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
+from .json_codec import dumps
 from .message import ExonumMessage
 
 # pylint: disable=C0103
 logger = getLogger(__name__)
 
+# Headers are passed to `requests` as is and never modified, so they are shared by all requests.
+_JSON_HEADERS = {"content-type": "application/json"}
+_BINARY_HEADERS = {"content-type": "application/octet-stream"}
+
+
+def create_session(pool_maxsize: int) -> requests.Session:
+    """
+    Creates a `requests.Session` with keep-alive connection pooling.
+
+    One pool is kept per (host, port) pair, so an ExonumClient talking to both the public
+    and the private API of a node needs two pools.
+
+    Parameters
+    ----------
+    pool_maxsize: int
+        Maximum amount of connections kept alive in a single pool.
+
+    Returns
+    -------
+    session: requests.Session
+        A session object which can be shared between several Api instances.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
 
 class Api:
     """Api class provides basic REST functionality."""
 
     # constants
     RUST_RUNTIME_ID = 0
+    POOL_MAXSIZE = 32
 
-    def __init__(self, hostname: str, port: int, schema: str):
+    def __init__(self, hostname: str, port: int, schema: str, session: Optional[requests.Session] = None):
         """
         Constructor of Api.
 
@@ -37,24 +72,62 @@ class Api:
             API port of an Exonum node.
         schema: str
              Communication protocol: 'https' or 'http'.
+        session: Optional[requests.Session]
+            Session used to perform requests. If not provided, a new session with
+            keep-alive connection pooling is created.
         """
         self.schema = schema
         self.hostname = hostname
         self.port = port
         # Example of a formatted prefix: "https://127.0.0.1:8000"
         self.endpoint_prefix = "{}://{}:{}/api".format(self.schema, hostname, port)
-
-    @staticmethod
-    def get(url: str, params: Optional[Dict[Any, Any]] = None) -> requests.Response:
-        """Internal wrapper over requests.get"""
-        return requests.get(url, params=params)
-
-    @staticmethod
-    def post(url: str, data: str, headers: Dict[str, str]) -> requests.Response:
-        """Internal wrapper over requests.post"""
-        return requests.post(url, data=data, headers=headers)
-
-
+        self._session = session if session is not None else create_session(self.POOL_MAXSIZE)
+
+    def get(self, url: str, params: Optional[Dict[Any, Any]] = None) -> requests.Response:
+        """Internal wrapper over requests.Session.get"""
+        return self._session.get(url, params=params)
+
+    def post(self, url: str, data: Union[str, bytes], headers: Dict[str, str]) -> requests.Response:
+        """Internal wrapper over requests.Session.post"""
+        return self._session.post(url, data=data, headers=headers)
+
+    def close(self) -> None:
+        """Closes the underlying session, releasing the pooled connections."""
+        self._session.close()
+
+
+def _split_batch_response(response: requests.Response, count: int) -> List[requests.Response]:
+    """Splits a response for a batch of `count` transactions into a response for every transaction."""
+    if response.status_code != 200:
+        return [response] * count
+
+    try:
+        items = response.json()
+    except ValueError:
+        items = None
+    if not isinstance(items, list) or len(items) != count:
+        logger.warning("Unexpected batch transactions response: %s", response.content)
+        return [response] * count
+
+    responses = []
+    for item in items:
+        tx_response = requests.Response()
+        tx_response.status_code = response.status_code
+        tx_response.reason = response.reason
+        # Headers are copied, since the batch `content-length` does not match the content of a single response.
+        tx_response.headers = CaseInsensitiveDict(response.headers)
+        tx_response.headers.pop("content-length", None)
+        tx_response.url = response.url
+        tx_response.request = response.request
+        tx_response.encoding = "utf-8"
+        # pylint: disable=protected-access
+        tx_response._content = dumps(item)
+        responses.append(tx_response)
+
+    return responses
+
+
+# pylint: disable=too-many-instance-attributes
 class PublicApi(Api):
     """PublicApi class provides methods to interact with the public API of an Exonum node."""
 
@@ -62,9 +135,24 @@ class PublicApi(Api):
         super().__init__(*args, **kwargs)
 
         self._tx_url = self.endpoint_prefix + "/explorer/v1/transactions"
+        self._tx_batch_url = self._tx_url + "/batch"
+        # Batch endpoints which the node reported to be not available.
+        self._unsupported_batch_urls: Set[str] = set()
         self._block_url = self.endpoint_prefix + "/explorer/v1/block"
         self._blocks_url = self.endpoint_prefix + "/explorer/v1/blocks"
         self._services_url = self.endpoint_prefix + "/services/supervisor/services"
+        # Executor used by `send_transactions`, created on the first use.
+        self._tx_executor: Optional[ThreadPoolExecutor] = None
+        # Guards creation and shutdown of the executor, since `send_transactions` can be called from several threads.
+        self._tx_executor_lock = Lock()
+
+    def close(self) -> None:
+        """Shuts down the transaction sending threads and closes the underlying session."""
+        with self._tx_executor_lock:
+            executor, self._tx_executor = self._tx_executor, None
+        if executor is not None:
+            executor.shutdown()
+        super().close()
 
     def get_block(self, height: int) -> requests.Response:
         """
@@ -100,7 +188,7 @@ class PublicApi(Api):
             Result of an API call.
             If it is successful, a JSON representation of the block will be in the response.
         """
-        return self.get(self._block_url, params={"height": height})
+        return self.get(f"{self._block_url}?height={height}")
 
     # pylint: disable=too-many-arguments
     def get_blocks(
@@ -142,21 +230,24 @@ class PublicApi(Api):
             Result of an API call.
             If it is successful, a JSON representation of the block range will be in the response.
         """
-        params: Dict[str, Union[int, str]] = dict()
-        params["count"] = count
+        # The query string is built by hand, since the most common call only provides `count`.
+        if earliest is None and latest is None and not (add_precommits or skip_empty_blocks or add_blocks_time):
+            return self.get(f"{self._blocks_url}?count={count}")
+
+        query = [f"count={count}"]
 
         if earliest:
-            params["earliest"] = earliest
+            query.append(f"earliest={earliest}")
         if latest:
-            params["latest"] = latest
+            query.append(f"latest={latest}")
         if add_precommits:
-            params["add_precommits"] = "true"
+            query.append("add_precommits=true")
         if skip_empty_blocks:
-            params["skip_empty_blocks"] = "true"
+            query.append("skip_empty_blocks=true")
         if add_blocks_time:
-            params["add_blocks_time"] = "true"
+            query.append("add_blocks_time=true")
 
-        return self.get(self._blocks_url, params=params)
+        return self.get(self._blocks_url + "?" + "&".join(query))
 
     def get_tx_info(self, tx_hash: str) -> requests.Response:
         """
@@ -302,13 +393,17 @@ class PublicApi(Api):
             Result of the POST request.
             If a transaction is correct and it is accepted, it will contain a JSON with a hash of the transaction.
         """
-        response = self.post(self._tx_url, data=message.pack_into_json(), headers={"content-type": "application/json"})
+        response = self.post(self._tx_url, data=message.pack_into_json_bytes(), headers=_JSON_HEADERS)
         return response
 
     def send_transactions(self, messages: Iterable[ExonumMessage]) -> List[requests.Response]:
         """
         Same as send_transaction, but for any iterable object over ExonumMessage.
 
+        Transactions are sent concurrently by a pool of at most `POOL_MAXSIZE` threads,
+        which matches the size of the connection pool. Order of the responses matches
+        the order of the messages.
+
         Parameters
         ----------
         messages: Iterable[ExonumMessage]
@@ -319,7 +414,72 @@ class PublicApi(Api):
         results: List[requests.Response]
             A list of responses for each sent transaction.
         """
-        return [self.send_transaction(message) for message in messages]
+        with self._tx_executor_lock:
+            if self._tx_executor is None:
+                self._tx_executor = ThreadPoolExecutor(max_workers=self.POOL_MAXSIZE)
+            executor = self._tx_executor
+        return list(executor.map(self.send_transaction, messages))
+
+    def send_transactions_batched(
+        self, messages: Iterable[ExonumMessage], chunk_size: int = 256, batch_url: Optional[str] = None
+    ) -> List[requests.Response]:
+        """
+        Same as send_transactions, but sends messages in chunks, packing every chunk into
+        a single POST request with a JSON array body.
+
+        This requires the node to provide a batch transactions endpoint which responds with a JSON array
+        containing a result for every transaction of the chunk. If the node responds with 404 or 405 status,
+        messages are sent via `send_transactions` instead, and this batch endpoint is not used anymore.
+
+        Parameters
+        ----------
+        messages: Iterable[ExonumMessage]
+            A sequence of messages to send.
+        chunk_size: int
+            Maximum amount of messages in a single request.
+        batch_url: Optional[str]
+            URL of the batch endpoint. Defaults to the transactions endpoint URL with the "/batch" suffix.
+
+        Returns
+        -------
+        results: List[requests.Response]
+            A list of responses for each sent transaction. For the messages sent in batches, every
+            response contains the corresponding item of the batch response array.
+            If a batch request fails, its response is returned for every message of the chunk.
+
+        Raises
+        ------
+        ValueError
+            An error will be raised if `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            err = ValueError(f"Chunk size must be a positive number, while {chunk_size} is given.")
+            logger.error("Error occurred during sending transactions: %s", err)
+            raise err
+
+        if batch_url is None:
+            batch_url = self._tx_batch_url
+
+        messages_list = list(messages)
+        results: List[requests.Response] = []
+        for start in range(0, len(messages_list), chunk_size):
+            chunk = messages_list[start : start + chunk_size]
+            if batch_url in self._unsupported_batch_urls:
+                results.extend(self.send_transactions(chunk))
+                continue
+
+            # Messages are already serialized, so the array is built without re-encoding them.
+            data = b"[" + b",".join(message.pack_into_json_bytes() for message in chunk) + b"]"
+            response = self.post(batch_url, data=data, headers=_JSON_HEADERS)
+            if response.status_code in (404, 405):
+                logger.info("Batch transactions endpoint is not available, sending transactions one by one.")
+                self._unsupported_batch_urls.add(batch_url)
+                results.extend(self.send_transactions(chunk))
+                continue
+
+            results.extend(_split_batch_response(response, len(chunk)))
+
+        return results
 
 
 class PrivateApi(Api):
@@ -328,7 +488,12 @@ class PrivateApi(Api):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
 
-        self._system_url = self.endpoint_prefix + "/system/v1/{}"
+        system_prefix = self.endpoint_prefix + "/system/v1/"
+        self._peers_url = system_prefix + "peers"
+        self._info_url = system_prefix + "info"
+        self._consensus_status_url = system_prefix + "consensus_status"
+        self._stats_url = system_prefix + "stats"
+        self._shutdown_url = system_prefix + "shutdown"
 
     def add_peer(self, address: str, public_key: str) -> requests.Response:
         """
@@ -344,8 +509,8 @@ class PrivateApi(Api):
         response: requests.Response
             Result of an API call.
         """
-        data = json.dumps({"address": address, "public_key": public_key})
-        response = self.post(self._system_url.format("peers"), data=data, headers={"content-type": "application/json"})
+        data = dumps({"address": address, "public_key": public_key})
+        response = self.post(self._peers_url, data=data, headers=_JSON_HEADERS)
         return response
 
     def get_info(self) -> requests.Response:
@@ -392,7 +557,7 @@ class PrivateApi(Api):
             Result of an API call.
             If it is successful, a list of peers will be returned.
         """
-        return self.get(self._system_url.format("info"))
+        return self.get(self._info_url)
 
     def set_consensus_interaction(self, enabled: bool = True) -> requests.Response:
         """
@@ -408,10 +573,8 @@ class PrivateApi(Api):
         response: requests.Response
             Result of an API call.
         """
-        data = json.dumps({"enabled": enabled})
-        return self.post(
-            self._system_url.format("consensus_status"), data=data, headers={"content-type": "application/json"}
-        )
+        data = dumps({"enabled": enabled})
+        return self.post(self._consensus_status_url, data=data, headers=_JSON_HEADERS)
 
     def get_stats(self) -> requests.Response:
         """
@@ -441,7 +604,7 @@ class PrivateApi(Api):
         response: requests.Response
             Result of an API call.
         """
-        return self.get(self._system_url.format("stats"))
+        return self.get(self._stats_url)
 
     def shutdown(self) -> requests.Response:
         """
@@ -454,8 +617,8 @@ class PrivateApi(Api):
         response: requests.Response
             Result of an API call.
         """
-        data = json.dumps(None)
-        return self.post(self._system_url.format("shutdown"), data=data, headers={"content-type": "application/json"})
+        data = dumps(None)
+        return self.post(self._shutdown_url, data=data, headers=_JSON_HEADERS)
 
 
 class ServiceApi(Api):
@@ -474,7 +637,9 @@ class ServiceApi(Api):
         """
         super().__init__(*args, **kwargs)
 
-        self._api_url = f"{self.schema}://{self.hostname}:{self.port}/api/services/{service_name}/"
+        # Service name is encoded once, so it can be safely used as a single segment of every endpoint URL.
+        encoded_service_name = quote(service_name, safe="")
+        self._api_url = f"{self.schema}://{self.hostname}:{self.port}/api/services/{encoded_service_name}/"
 
     def service_endpoint(self, sub_uri: str) -> str:
         """
@@ -527,9 +692,6 @@ class ServiceApi(Api):
         response: requests.Response
             Result of an API call.
         """
-        if data_format == "json":
-            headers = {"content-type": "application/json"}
-        else:
-            headers = {"content-type": "application/octet-stream"}
+        headers = _JSON_HEADERS if data_format == "json" else _BINARY_HEADERS
 
         return self.post(self.service_endpoint(sub_uri), data=data, headers=headers)
@@ -1,19 +1,22 @@
 """
 Exonum Client Module.
 
-This module provides you with two handy classes:
+This module provides you with three handy classes:
   - ExonumClient: The main entity to interact with the Exonum blockchain.
   - Subscriber: An entity that can be used to receive signals on creation of a new block.
+  - AsyncSubscriber: Same as Subscriber, but works within an asyncio event loop instead of a separate thread.
 """
-from typing import Optional, Any, Callable, Union, Dict, Tuple
+from typing import Optional, Any, Awaitable, Callable, Union, Dict, List, Tuple
 
 import json
+import select
 from logging import getLogger
 from threading import Thread
 from urllib.parse import urlencode
-from websocket import WebSocket
+from websocket import ABNF, WebSocket
 
-from .api import ServiceApi, PublicApi, PrivateApi
+from .api import ServiceApi, PublicApi, PrivateApi, Api, create_session
+from .json_codec import dumps
 from .protobuf_loader import ProtobufLoader
 from .message import ExonumMessage
 from .protobuf_provider import ProtobufProvider, ExonumApiProvider
@@ -22,6 +25,25 @@ from .protobuf_provider import ProtobufProvider, ExonumApiProvider
 logger = getLogger(__name__)
 
 
+def _websocket_address(
+    address: str, port: int, subscription_type: Optional[str], filters: Optional[Dict[str, Any]]
+) -> str:
+    """Creates an address of the websocket endpoint for a subscriber."""
+    if not subscription_type:
+        return Subscriber.SENDING_WEBSOCKET_URI.format(address, port)
+
+    if subscription_type not in Subscriber.SUBSCRIPTION_TYPES:
+        err = ValueError(
+            f"Subscription type must be one of these: {Subscriber.SUBSCRIPTION_TYPES}, "
+            f"while {subscription_type} is given."
+        )
+        logger.error("Error occurred during subscriber initialization: %s", err)
+        raise err
+    parameters = "?" + urlencode(filters) if filters else ""
+    return Subscriber.SUBSCRIPTION_WEBSOCKET_URI.format(address, port, subscription_type) + parameters
+
+
+# pylint: disable=too-many-instance-attributes
 class Subscriber:
     """ Subscriber objects are used to subscribe to Exonum blocks via websockets. """
 
@@ -34,6 +56,8 @@ class Subscriber:
     ReceiveType = Union[bytes, str]
     # Type of the `Callback` (`Callable` that takes `ReceiveType` as an argument and produces nothing).
     CallbackType = Callable[[ReceiveType], None]
+    # Type of the batch `Callback` (`Callable` that takes a list of `ReceiveType` and produces nothing).
+    BatchCallbackType = Callable[[List[ReceiveType]], None]
 
     def __init__(
         self, address: str, port: int, subscription_type: Optional[str] = None, filters: Optional[Dict[str, Any]] = None
@@ -52,23 +76,15 @@ class Subscriber:
         filters: Optional[Dict[str, Any]]
             Dictionary of filters, such as 'service_id' and 'tx_id' for transactions.
         """
-        if not subscription_type:
-            self._address = self.SENDING_WEBSOCKET_URI.format(address, port)
-        else:
-            if subscription_type not in Subscriber.SUBSCRIPTION_TYPES:
-                err = ValueError(
-                    f"Subscription type must be one of these: {self.SUBSCRIPTION_TYPES}, "
-                    f"while {subscription_type} is given."
-                )
-                logger.error("Error occurred during subscriber initialization: %s", err)
-                raise err
-            parameters = "?" + urlencode(filters) if filters else ""
-            self._address = self.SUBSCRIPTION_WEBSOCKET_URI.format(address, port, subscription_type) + parameters
+        self._address = _websocket_address(address, port, subscription_type, filters)
         self._is_running = False
         self._connected = False
         self._ws_client = WebSocket()
-        self._thread = Thread(target=self._event_processing)
+        self._thread = Thread(target=self._event_processing, daemon=True)
         self._handler: Optional[Subscriber.CallbackType] = None
+        self._batch_handler: Optional[Subscriber.BatchCallbackType] = None
+        self._max_batch = 1
+        self._max_wait = 0.0
 
     def __enter__(self) -> "Subscriber":
         self.connect()
@@ -79,29 +95,105 @@ class Subscriber:
         self.stop()
 
     def connect(self) -> None:
-        """Connects the subscriber to the Exonum, so it will be able to receive events. """
+        """Connects the subscriber to the Exonum, so it will be able to receive events.
+        Does nothing if the subscriber is already connected."""
+        if self._connected:
+            return
+
+        # No timeout: `recv` blocks until the next event instead of polling the socket.
+        self._ws_client.settimeout(None)
         self._ws_client.connect(self._address)
         self._connected = True
 
     def set_handler(self, handler: "Subscriber.CallbackType") -> None:
-        """Sets the handler """
+        """Sets the handler. Handler should be set before calling `run`. """
         self._handler = handler
+        self._batch_handler = None
+
+    def set_batch_handler(
+        self, handler: "Subscriber.BatchCallbackType", max_batch: int = 64, max_wait_ms: float = 1
+    ) -> None:
+        """
+        Sets the batch handler, which replaces the handler set via `set_handler`.
+        Handler should be set before calling `run`.
+
+        Batch handler is called with a list of events: after an event is received, subscriber
+        keeps collecting the events which arrive within `max_wait_ms` milliseconds from each other,
+        until `max_batch` events are collected. Thus the first event is dispatched with no extra delay
+        if there are no other events, while bursts of events are processed by the handler at once.
+
+        Parameters
+        ----------
+        handler: Subscriber.BatchCallbackType
+            Callable that takes a list of received events.
+        max_batch: int
+            Maximum amount of events in a single batch.
+        max_wait_ms: float
+            Time in milliseconds to wait for the next event of the batch.
+        """
+        self._batch_handler = handler
+        self._handler = None
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
 
     def run(self) -> None:
-        """Runs the subscriber thread. It will call the provided handler on every new block. """
+        """Runs the subscriber thread. It will call the handler provided via `set_handler` on every new block.
+
+        Raises
+        ------
+        RuntimeError
+            An error will be raised if no handler is set.
+        """
+        if self._handler is None and self._batch_handler is None:
+            logger.critical("Attempt to run a subscriber without a handler.")
+            raise RuntimeError("Subscriber handler is not set, `set_handler` should be called before `run`.")
+
         try:
             self._is_running = True
-            self._thread.setDaemon(True)
             self._thread.start()
             logger.debug("Subscriber thread started successfully.")
         except RuntimeError as error:
             logger.error("Error occurred during running subscriber thread: %s", error)
 
     def _event_processing(self) -> None:
+        if self._batch_handler is not None:
+            self._batch_event_processing(self._batch_handler)
+            return
+
+        # Handler is checked in `run` before the thread is started, so it is bound to a local only once,
+        # as well as `recv`: local lookups are cheaper than attribute lookups on every event.
+        handler = self._handler
+        assert handler is not None  # For type checkers only, `run` raises if there is no handler.
+        recv = self._ws_client.recv
         while self._is_running:
-            data = self._ws_client.recv()
-            if data and self._handler:
-                self._handler(data)
+            data = recv()
+            if not data:
+                continue
+            handler(data)
+
+    def _batch_event_processing(self, handler: "Subscriber.BatchCallbackType") -> None:
+        recv = self._ws_client.recv
+        recv_data = self._ws_client.recv_data
+        sock = self._ws_client.sock
+        max_batch = self._max_batch
+        max_wait = self._max_wait
+        while self._is_running:
+            data = recv()
+            if not data:
+                continue
+            batch = [data]
+            # Socket is kept blocking: `select` only tells if the next frame has started to arrive.
+            # It can be a control frame as well, so the batch is dispatched once one is received:
+            # `recv` would answer a ping and then block until the next data frame.
+            while len(batch) < max_batch and select.select([sock], [], [], max_wait)[0]:
+                opcode, data = recv_data(control_frame=True)
+                if opcode == ABNF.OPCODE_TEXT:
+                    data = data.decode("utf-8")
+                elif opcode != ABNF.OPCODE_BINARY:
+                    break
+                if data:
+                    batch.append(data)
+            handler(batch)
 
     def wait_for_new_event(self) -> None:
         """ Waits until a new event (block or transaction) is ready. Please note that this method is a blocking one. """
@@ -111,17 +203,25 @@ class Subscriber:
             self._ws_client.recv()
 
     def stop(self) -> None:
-        """Closes connection with the websocket and, if the thread is running, joins it. """
+        """Closes connection with the websocket and, if the thread is running, joins it.
+        After that the subscriber can be connected and run again."""
         if self._is_running:
             self._is_running = False
 
         if self._connected:
             self._ws_client.close()
+            # `close` does not reset the frame parser state of the WebSocket object, and the thread may leave
+            # a partially read frame in it, so a new object is created for the next `connect`.
+            self._ws_client = WebSocket()
             self._connected = False
 
         if self._thread.is_alive():
             self._thread.join()
 
+        if self._thread.ident is not None:
+            # A thread can be started only once, so a new one is prepared for the next `run`.
+            self._thread = Thread(target=self._event_processing, daemon=True)
+
     def send_transaction(self, message: ExonumMessage) -> str:
         """
         Sends a transaction into an Exonum node via WebSocket.
@@ -143,7 +243,7 @@ class Subscriber:
         if body_raw is None:
             logger.critical("Attempt to send an unsigned message through websocket.")
             raise RuntimeError("Attempt to send an unsigned message.")
-        data = json.dumps({"type": "transaction", "payload": {"tx_body": body_raw.hex()}})
+        data = dumps({"type": "transaction", "payload": {"tx_body": body_raw.hex()}}).decode()
 
         ws_client = WebSocket()
         ws_client.connect(self._address)
@@ -154,6 +254,86 @@ class Subscriber:
         return response
 
 
+class AsyncSubscriber:
+    """
+    AsyncSubscriber objects are used to subscribe to Exonum blocks via websockets within an asyncio event loop.
+
+    Unlike Subscriber, AsyncSubscriber does not create a thread, so a single event loop can serve
+    many subscriptions at once:
+
+    >>> async def handler(data):
+    >>>     print(data)
+    >>>
+    >>> async with client.create_async_subscriber("blocks") as blocks:
+    >>>     async with client.create_async_subscriber("transactions") as transactions:
+    >>>         await asyncio.gather(blocks.run(handler), transactions.run(handler))
+
+    AsyncSubscriber requires the `websockets` package to be installed.
+    """
+
+    # Type of the async `Callback` (`Callable` that takes `Subscriber.ReceiveType` and returns an awaitable).
+    AsyncCallbackType = Callable[[Subscriber.ReceiveType], Awaitable[None]]
+
+    # Interval in seconds between keepalive pings.
+    PING_INTERVAL = 20
+
+    def __init__(
+        self, address: str, port: int, subscription_type: Optional[str] = None, filters: Optional[Dict[str, Any]] = None
+    ):
+        """AsyncSubscriber constructor.
+
+        Parameters are the same as in the Subscriber constructor.
+        """
+        self._address = _websocket_address(address, port, subscription_type, filters)
+        self._ws: Any = None
+
+    async def __aenter__(self) -> "AsyncSubscriber":
+        await self.connect()
+
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type], exc_value: Optional[Any], exc_traceback: Optional[object]
+    ) -> None:
+        await self.stop()
+
+    async def connect(self) -> None:
+        """Connects the subscriber to the Exonum, so it will be able to receive events. """
+        if self._ws is not None:
+            return
+
+        try:
+            # pylint: disable=import-outside-toplevel
+            import websockets
+        except ImportError as error:
+            logger.critical("AsyncSubscriber requires the `websockets` package to be installed.")
+            raise RuntimeError("AsyncSubscriber requires the `websockets` package to be installed.") from error
+
+        self._ws = await websockets.connect(self._address, ping_interval=self.PING_INTERVAL)
+
+    async def run(self, handler: "AsyncSubscriber.AsyncCallbackType") -> None:
+        """Awaits the provided handler on every new event until the connection is closed. """
+        if self._ws is None:
+            raise RuntimeError("AsyncSubscriber should be connected before running.")
+
+        async for data in self._ws:
+            await handler(data)
+
+    async def wait_for_new_event(self) -> None:
+        """ Waits until a new event (block or transaction) is ready. """
+        if self._ws is None:
+            raise RuntimeError("AsyncSubscriber should be connected before waiting for events.")
+
+        await self._ws.recv()
+
+    async def stop(self) -> None:
+        """Closes connection with the websocket. """
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+
+# pylint: disable=too-many-instance-attributes
 class ExonumClient:
     """ExonumClient class is capable of interaction with ExonumBlockchain.
 
@@ -177,6 +357,13 @@ class ExonumClient:
     >>> user_agent = client.public_api.user_agent().json()
     exonum 1.0.0/rustc 1.42.0 (eae3437df 2019-08-13)
 
+    All the API objects created by the client share a single `requests.Session`, so connections
+    to the node are kept alive and reused between calls. Call `close` (or use the client as a context
+    manager) to release them:
+
+    >>> with ExonumClient(hostname="127.0.0.1", public_api_port=8080, private_api_port=8081) as client:
+    >>>     client.public_api.get_block(1)
+
     # Websocket interaction
 
     To interact with the Exonum node via webscokets, one should create a Subscriber object.
@@ -244,12 +431,17 @@ class ExonumClient:
         self.public_api_port = public_api_port
         self.private_api_port = private_api_port
 
-        self.public_api = PublicApi(hostname, public_api_port, self.schema)
-        self.private_api = PrivateApi(hostname, private_api_port, self.schema)
+        # A single session is shared by all the API objects, so connections to the node are reused.
+        self._session = create_session(Api.POOL_MAXSIZE)
+
+        self.public_api = PublicApi(hostname, public_api_port, self.schema, session=self._session)
+        self.private_api = PrivateApi(hostname, private_api_port, self.schema, session=self._session)
+        # Service API objects are created once per (service name, is private) pair.
+        self._service_apis: Dict[Tuple[str, bool], ServiceApi] = {}
 
         # Initialize protobuf provider.
         rust_runtime_id = 0
-        exonum_api_protobuf_provider = ExonumApiProvider(hostname, public_api_port, self.schema)
+        exonum_api_protobuf_provider = ExonumApiProvider(hostname, public_api_port, self.schema, session=self._session)
         self.protobuf_provider = ProtobufProvider()
         self.protobuf_provider.add_fallback_provider(rust_runtime_id, exonum_api_protobuf_provider)
 
@@ -264,8 +456,29 @@ class ExonumClient:
 
         return json.dumps(d, indent=2)
 
+    def __enter__(self) -> "ExonumClient":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_value: Optional[Any], exc_traceback: Optional[object]) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the transaction sending threads and closes the HTTP session shared by the client API objects."""
+        # Session is shared, so closing it via the public API releases connections of all the API objects.
+        self.public_api.close()
+
+    def _service_api(self, service_name: str, private: bool) -> ServiceApi:
+        key = (service_name, private)
+        service_api = self._service_apis.get(key)
+        if service_api is None:
+            port = self.private_api_port if private else self.public_api_port
+            service_api = ServiceApi(service_name, self.hostname, port, self.schema, session=self._session)
+            self._service_apis[key] = service_api
+        return service_api
+
     def service_private_api(self, service_name: str) -> ServiceApi:
-        """Creates an instances of ServiceApi to interact with private API of a service.
+        """Returns an instance of ServiceApi to interact with private API of a service.
+        The instance is created on the first call and reused afterwards.
 
         Parameters
         ----------
@@ -277,10 +490,11 @@ class ExonumClient:
         service_api: ServiceApi
             An instance of ServiceApi for private API.
         """
-        return ServiceApi(service_name, self.hostname, self.private_api_port, self.schema)
+        return self._service_api(service_name, private=True)
 
     def service_public_api(self, service_name: str) -> ServiceApi:
-        """Creates an instances of ServiceApi to interact with public API of a service.
+        """Returns an instance of ServiceApi to interact with public API of a service.
+        The instance is created on the first call and reused afterwards.
 
         Parameters
         ----------
@@ -292,10 +506,10 @@ class ExonumClient:
         service_api: ServiceApi
             An instance of ServiceApi for public API.
         """
-        return ServiceApi(service_name, self.hostname, self.public_api_port, self.schema)
+        return self._service_api(service_name, private=False)
 
     def service_apis(self, service_name: str) -> Tuple[ServiceApi, ServiceApi]:
-        """Creates a tuple of ServiceApi instances to interact with public and private API of a service.
+        """Returns a tuple of ServiceApi instances to interact with public and private API of a service.
 
         Parameters
         ----------
@@ -341,3 +555,21 @@ class ExonumClient:
         """
         subscriber = Subscriber(self.hostname, self.public_api_port, subscription_type)
         return subscriber
+
+    def create_async_subscriber(self, subscription_type: str) -> AsyncSubscriber:
+        """
+        Creates an AsyncSubscriber object from the current ExonumClient object.
+
+        See AsyncSubscriber docs for details.
+
+        Example:
+
+        >>> async with client.create_async_subscriber("blocks") as subscriber:
+        >>>     await subscriber.wait_for_new_event()
+
+        Parameters
+        ----------
+        subscription_type: str
+            Sets type of subscription: "blocks" or "transactions".
+        """
+        return AsyncSubscriber(self.hostname, self.public_api_port, subscription_type)
@@ -0,0 +1,32 @@
+"""
+JSON codec used by the client.
+
+If the optional `orjson` package is installed, it is used to serialize and parse JSON,
+otherwise the standard `json` module is used. Serialized JSON is always returned as `bytes`,
+so it can be passed to `requests` without any additional encoding.
+"""
+
+from typing import Any, Union
+
+# pylint: disable=no-member
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes an object into compact JSON."""
+        return orjson.dumps(obj)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parses JSON from bytes or a string."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes an object into compact JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parses JSON from bytes or a string."""
+        return json.loads(data)
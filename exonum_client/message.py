@@ -1,12 +1,12 @@
 """This module is capable of creating and signing Exonum transactions."""
 
 from typing import Dict, Optional, Tuple, Any
-import json
 from logging import getLogger
 
 from google.protobuf.message import Message as ProtobufMessage, DecodeError as ProtobufDecodeError
 
 from .crypto import PublicKey, Hash, Signature, KeyPair
+from .json_codec import dumps
 from .module_manager import ModuleManager
 
 # pylint: disable=C0103
@@ -274,10 +274,25 @@ class ExonumMessage:
         RuntimeError
             An error will be raised on attempt to call `pack_into_json` with an unsigned message.
         """
+        return self.pack_into_json_bytes().decode()
+
+    def pack_into_json_bytes(self) -> bytes:
+        """Same as `pack_into_json`, but returns UTF-8 encoded JSON, which can be sent without re-encoding.
+
+        Returns
+        -------
+        json_message: bytes
+            Bytes with a JSON representation of the serialized message.
+
+        Raises
+        ------
+        RuntimeError
+            An error will be raised on attempt to call `pack_into_json_bytes` with an unsigned message.
+        """
         if self._signed_tx_raw is None:
             logger.critical("Attempt to call `to_json` on an unsigned message into JSON format.")
             raise RuntimeError("Attempt to pack an unsigned message.")
-        return json.dumps({"tx_body": self._signed_tx_raw.hex()}, indent=4)
+        return dumps({"tx_body": self._signed_tx_raw.hex()})
 
     def hash(self) -> Hash:
         """Returns a hash of the message. If the message is not signed, a hash of an empty message will be returned."""
@@ -10,6 +10,7 @@ from logging import getLogger
 
 from exonum_client.protobuf_loader import ProtoFile, ProtobufProviderInterface
 from exonum_client.api import Api
+from exonum_client.json_codec import loads
 
 # pylint: disable=C0103
 logger = getLogger(__name__)
@@ -21,12 +22,11 @@ class ExonumApiProvider(Api, ProtobufProviderInterface):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
 
-        self._rust_runtime_url = self.endpoint_prefix + "/runtimes/rust/{}"
+        self._proto_sources_url = self.endpoint_prefix + "/runtimes/rust/proto-sources"
 
     def _get_proto_sources(self, params: Optional[Dict[str, str]] = None) -> List[ProtoFile]:
         """Retrieves protobuf sources."""
-        proto_sources_endpoint = self._rust_runtime_url.format("proto-sources")
-        response = self.get(proto_sources_endpoint, params=params)
+        response = self.get(self._proto_sources_url, params=params)
         if response.status_code != 200 or "application/json" not in response.headers["content-type"]:
             logger.critical(
                 "Unsuccessfully attempted to retrieve Protobuf sources.\n" "Status code: %s,\n" "body:\n%s",
@@ -36,12 +36,11 @@ class ExonumApiProvider(Api, ProtobufProviderInterface):
             raise RuntimeError("Unsuccessfully attempted to retrieve Protobuf sources: {!r}".format(response.content))
         logger.debug("Protobuf sources retrieved successfully.")
 
-        proto_files = [
-            ProtoFile(name=proto_file["name"], content=proto_file["content"]) for proto_file in response.json()
+        # Raw body is passed to the JSON codec: with `orjson` installed it is parsed without decoding it into `str`.
+        return [
+            ProtoFile(name=proto_file["name"], content=proto_file["content"]) for proto_file in loads(response.content)
         ]
 
-        return proto_files
-
     def get_main_proto_sources(self) -> List[ProtoFile]:
         """Performs a GET request to the `proto-sources` Exonum endpoint."""
         params = {"type": "core"}
@@ -4,6 +4,8 @@ import setuptools
 
 INSTALL_REQUIRES = ["protobuf", "pysodium", "requests", "websocket-client-py3"]
 
+EXTRAS_REQUIRE = {"orjson": ["orjson"], "async": ["websockets"]}
+
 PYTHON_REQUIRES = ">=3.4"
 
 with open("README.md", "r") as readme:
@@ -26,6 +28,7 @@ setuptools.setup(
         "exonum_client.protobuf_provider",
     ],
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     python_requires=PYTHON_REQUIRES,
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -2,6 +2,7 @@
 # type: ignore
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, Mock
 import random
 
@@ -29,6 +30,17 @@ class TestApi(unittest.TestCase):
         resp = self.api.post(url)
         self.assertEqual(resp.status_code, 200)
 
+    def test_get_uses_session(self):
+        url = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PUBLIC_PORT)
+        with patch.object(self.api._session, "get", return_value=mock_response(200)) as session_get:
+            resp = self.api.get(url, params={"a": 1})
+        session_get.assert_called_once_with(url, params={"a": 1})
+        self.assertEqual(resp.status_code, 200)
+
+    def test_shared_session(self):
+        other_api = Api(EXONUM_IP, EXONUM_PRIVATE_PORT, EXONUM_PROTO, session=self.api._session)
+        self.assertIs(other_api._session, self.api._session)
+
 
 class TestPublicApi(unittest.TestCase):
     def setUp(self):
@@ -39,6 +51,81 @@ class TestPublicApi(unittest.TestCase):
         resp = self.public_api.send_transaction(Mock())
         self.assertEqual(resp.status_code, 200)
 
+    def test_send_transactions(self):
+        messages = [Mock() for _ in range(10)]
+        with patch.object(self.public_api, "send_transaction", side_effect=lambda message: message) as send:
+            resps = self.public_api.send_transactions(messages)
+        self.assertEqual(resps, messages)
+        self.assertEqual(send.call_count, len(messages))
+
+        self.public_api.close()
+        self.assertIsNone(self.public_api._tx_executor)
+
+    def test_send_transactions_concurrent_calls(self):
+        messages = [Mock() for _ in range(4)]
+        with patch.object(self.public_api, "send_transaction", side_effect=lambda message: message), patch(
+            "exonum_client.api.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor_cls, ThreadPoolExecutor(max_workers=8) as callers:
+            results = list(callers.map(lambda _: self.public_api.send_transactions(messages), range(8)))
+
+        # Only one executor is created, so `close` shuts down every thread used to send transactions.
+        executor_cls.assert_called_once()
+        self.assertTrue(all(result == messages for result in results))
+        self.public_api.close()
+
+    def test_send_transactions_batched(self):
+        messages = [Mock() for _ in range(5)]
+        for idx, message in enumerate(messages):
+            message.pack_into_json_bytes.return_value = b'{"tx_body": "%02x"}' % idx
+
+        batch_responses = [
+            mock_response(200, [{"tx_hash": "%02x" % idx} for idx in idxs]) for idxs in ([0, 1], [2, 3], [4])
+        ]
+        for batch_response in batch_responses:
+            batch_response.headers["content-length"] = str(len(batch_response.content))
+        with patch.object(self.public_api, "post", side_effect=batch_responses) as post:
+            resps = self.public_api.send_transactions_batched(messages, chunk_size=2)
+
+        self.assertEqual(post.call_count, 3)
+        self.assertEqual(post.call_args_list[0][1]["data"], b'[{"tx_body": "00"},{"tx_body": "01"}]')
+        self.assertEqual([resp.json()["tx_hash"] for resp in resps], ["00", "01", "02", "03", "04"])
+        self.assertTrue(all(resp.status_code == 200 for resp in resps))
+        self.assertTrue(all("content-length" not in resp.headers for resp in resps))
+
+    def test_send_transactions_batched_fallback(self):
+        messages = [Mock() for _ in range(3)]
+        for message in messages:
+            message.pack_into_json_bytes.return_value = b"{}"
+
+        with patch.object(self.public_api, "post", return_value=mock_response(404)) as post, patch.object(
+            self.public_api, "send_transactions", side_effect=lambda chunk: list(chunk)
+        ) as send_transactions:
+            resps = self.public_api.send_transactions_batched(messages, chunk_size=2)
+
+        # Batch endpoint is requested only once.
+        post.assert_called_once()
+        self.assertEqual(send_transactions.call_count, 2)
+        self.assertEqual(resps, messages)
+
+        # Another batch endpoint is still used.
+        other_batch_url = "http://other/batch"
+        with patch.object(
+            self.public_api, "post", return_value=mock_response(200, [{"tx_hash": "00"}] * 3)
+        ) as post, patch.object(self.public_api, "send_transactions") as send_transactions:
+            resps = self.public_api.send_transactions_batched(messages, batch_url=other_batch_url)
+
+        self.assertEqual(post.call_args[0][0], other_batch_url)
+        send_transactions.assert_not_called()
+        self.assertEqual(len(resps), len(messages))
+
+    def test_send_transactions_batched_chunk_size(self):
+        with patch.object(self.public_api, "post") as post:
+            for chunk_size in (0, -1):
+                with self.assertRaises(ValueError):
+                    self.public_api.send_transactions_batched([Mock()], chunk_size=chunk_size)
+
+        post.assert_not_called()
+
     @patch("exonum_client.api.PublicApi.get", new=mock_requests_get)
     def test_get_block(self):
         height = random.randrange(0, 20)
@@ -74,6 +161,20 @@ class TestPublicApi(unittest.TestCase):
         resp = self.public_api.get_blocks(count, latest=latest, earliest=earliest)
         self.assertEqual(resp.status_code, 200)
 
+    def test_get_blocks_query(self):
+        blocks_endpoint = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PUBLIC_PORT)
+        blocks_endpoint += EXPLORER_ENDPOINT_POSTFIX.format("blocks")
+
+        with patch.object(self.public_api, "get") as get:
+            self.public_api.get_blocks(5)
+            get.assert_called_once_with(blocks_endpoint + "?count=5")
+
+        with patch.object(self.public_api, "get") as get:
+            self.public_api.get_blocks(5, latest=10, skip_empty_blocks=True, add_blocks_time=True)
+            get.assert_called_once_with(
+                blocks_endpoint + "?count=5&latest=10&skip_empty_blocks=true&add_blocks_time=true"
+            )
+
     @patch("exonum_client.api.PublicApi.get", new=mock_requests_get)
     def test_get_tx_info(self):
         tx_hash = "-" * 64
@@ -84,6 +185,13 @@ class TestPublicApi(unittest.TestCase):
         resp = self.public_api.get_tx_info(tx_hash)
         self.assertEqual(resp.status_code, 200)
 
+        # Hash is passed via `params`, so it is encoded by `requests`:
+        tx_url = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PUBLIC_PORT)
+        tx_url += EXPLORER_ENDPOINT_POSTFIX.format("transactions")
+        with patch.object(self.public_api, "get") as get:
+            self.public_api.get_tx_info("0" * 64)
+        get.assert_called_once_with(tx_url, params={"hash": "0" * 64})
+
 
 class TestPrivateApi(unittest.TestCase):
     def setUp(self):
@@ -143,3 +251,11 @@ class TestServiceApi(unittest.TestCase):
         expected_private_endpoint = exonum_private_base + SERVICE_ENDPOINT_POSTFIX.format(service, endpoint)
 
         self.assertEqual(got_endpoint, expected_private_endpoint)
+
+        # Test that a service name is encoded as a single URL segment:
+        service_api = ServiceApi("my service/1", EXONUM_IP, EXONUM_PUBLIC_PORT, EXONUM_PROTO)
+        got_endpoint = service_api.service_endpoint(endpoint)
+
+        expected_endpoint = exonum_public_base + SERVICE_ENDPOINT_POSTFIX.format("my%20service%2F1", endpoint)
+
+        self.assertEqual(got_endpoint, expected_endpoint)
@@ -1,13 +1,18 @@
 # pylint: disable=missing-docstring, protected-access
 # type: ignore
 
+import asyncio
+import socket
 import unittest
+from threading import Event
 from unittest.mock import patch, Mock
 import random
 
+from websocket import ABNF, WebSocket
+
 random.seed(0)
 
-from exonum_client.client import ExonumClient, Subscriber
+from exonum_client.client import ExonumClient, Subscriber, AsyncSubscriber
 from .testing_utils import *
 
 
@@ -20,6 +25,25 @@ class TestExonumClient(unittest.TestCase):
             hostname=EXONUM_IP, public_api_port=EXONUM_PUBLIC_PORT, private_api_port=EXONUM_PRIVATE_PORT
         )
 
+    def test_apis_share_session(self):
+        service_public_api, service_private_api = self.client.service_apis("service")
+        for api in (self.client.public_api, self.client.private_api, service_public_api, service_private_api):
+            self.assertIs(api._session, self.client._session)
+
+    def test_service_apis_reused(self):
+        service_public_api, service_private_api = self.client.service_apis("service")
+        self.assertIs(self.client.service_public_api("service"), service_public_api)
+        self.assertIs(self.client.service_private_api("service"), service_private_api)
+        self.assertIsNot(service_public_api, service_private_api)
+        self.assertEqual(service_public_api.port, EXONUM_PUBLIC_PORT)
+        self.assertEqual(service_private_api.port, EXONUM_PRIVATE_PORT)
+
+    def test_close(self):
+        with patch.object(self.client._session, "close") as session_close:
+            with self.client as client:
+                self.assertIs(client, self.client)
+        session_close.assert_called_once_with()
+
 
 # Subscriber tests
 class TestSubscriber(unittest.TestCase):
@@ -42,3 +66,176 @@ class TestSubscriber(unittest.TestCase):
         self.subscriber._ws_client = Mock()
 
         self.assertEqual(self.subscriber.wait_for_new_event(), None)
+
+    def test_connect_stop(self):
+        ws_client = Mock()
+        self.subscriber._ws_client = ws_client
+
+        self.subscriber.connect()
+        self.subscriber.connect()
+        ws_client.connect.assert_called_once_with(self.subscriber._address)
+
+        # Run the subscriber thread which stops on the first event.
+        ws_client.recv.side_effect = lambda: setattr(self.subscriber, "_is_running", False)
+        self.subscriber.set_handler(lambda data: None)
+        self.subscriber.run()
+        thread = self.subscriber._thread
+        self.subscriber.stop()
+        ws_client.close.assert_called_once_with()
+
+        # Subscriber can be connected and run again with a new WebSocket object.
+        self.assertIsNot(self.subscriber._ws_client, ws_client)
+        self.assertIsNot(self.subscriber._thread, thread)
+
+    def test_reconnect_receives_events(self):
+        server_sockets = []
+
+        def create_websocket():
+            ws_client = WebSocket()
+
+            def connect(_address):
+                ws_client.sock, server_socket = socket.socketpair()
+                ws_client.connected = True
+                server_sockets.append(server_socket)
+
+            ws_client.connect = connect
+            return ws_client
+
+        received = []
+        event_received = Event()
+
+        def handler(data):
+            received.append(data)
+            subscriber._is_running = False
+            event_received.set()
+
+        with patch("exonum_client.client.WebSocket", side_effect=create_websocket):
+            subscriber = Subscriber("address", 8080, "blocks")
+            subscriber.set_handler(handler)
+            for event in ["first", "second"]:
+                subscriber.connect()
+                server_sockets[-1].sendall(text_frame(event))
+                subscriber.run()
+                self.assertTrue(event_received.wait(1))
+                event_received.clear()
+                # Thread may be stopped in the middle of a frame, which leaves the frame parser state behind.
+                subscriber._ws_client._frame_header = b"\x81\x03"
+                subscriber.stop()
+
+        self.assertEqual(received, ["first", "second"])
+        for server_socket in server_sockets:
+            server_socket.close()
+
+    def test_run_without_handler(self):
+        with self.assertRaises(RuntimeError):
+            self.subscriber.run()
+
+        self.assertFalse(self.subscriber._is_running)
+        self.assertIsNone(self.subscriber._thread.ident)
+
+    def test_event_processing(self):
+        events = ["first", "", "second", "third"]
+        received = []
+
+        def handler(data):
+            received.append(data)
+            if len(received) == 3:
+                self.subscriber._is_running = False
+
+        self.subscriber._ws_client = Mock()
+        self.subscriber._ws_client.recv.side_effect = events
+        self.subscriber.set_handler(handler)
+        self.subscriber._is_running = True
+        self.subscriber._event_processing()
+
+        self.assertEqual(received, ["first", "second", "third"])
+
+    @patch("exonum_client.client.select.select")
+    def test_batch_event_processing(self, select_mock):
+        # After "first" two more frames are ready, then there is a pause, then another burst.
+        select_mock.side_effect = [([1], [], []), ([1], [], []), ([], [], []), ([1], [], []), ([1], [], [])]
+        received = []
+
+        def handler(batch):
+            received.append(batch)
+            if len(received) == 2:
+                self.subscriber._is_running = False
+
+        self.subscriber._ws_client = Mock()
+        self.subscriber._ws_client.recv.side_effect = ["first", "third"]
+        self.subscriber._ws_client.recv_data.side_effect = [
+            (ABNF.OPCODE_TEXT, b"second"),
+            (ABNF.OPCODE_TEXT, b""),
+            (ABNF.OPCODE_TEXT, b"fourth"),
+            (ABNF.OPCODE_BINARY, b"fifth"),
+        ]
+        self.subscriber.set_batch_handler(handler, max_batch=3)
+        self.subscriber._is_running = True
+        self.subscriber._event_processing()
+
+        self.assertEqual(received, [["first", "second"], ["third", "fourth", b"fifth"]])
+        self.assertIsNone(self.subscriber._handler)
+
+    def test_batch_event_processing_ping(self):
+        received = []
+        batch_received = Event()
+
+        def handler(batch):
+            received.append(batch)
+            self.subscriber._is_running = False
+            batch_received.set()
+
+        ws_client = WebSocket()
+        ws_client.sock, server_socket = socket.socketpair()
+        self.subscriber._ws_client = ws_client
+        # Ping is readable within the wait time, but no data frame follows it.
+        server_socket.sendall(text_frame("first") + b"\x89\x00")
+        self.subscriber.set_batch_handler(handler, max_wait_ms=1000)
+        self.subscriber.run()
+
+        self.assertTrue(batch_received.wait(1))
+        self.assertEqual(received, [["first"]])
+        # Ping is still answered with a pong.
+        self.assertEqual(server_socket.recv(2)[0], 0x8A)
+
+        self.subscriber._thread.join()
+        ws_client.sock.close()
+        server_socket.close()
+
+
+class TestAsyncSubscriber(unittest.TestCase):
+    def setUp(self):
+        self.subscriber = AsyncSubscriber("address", 8080, "blocks")
+
+    def test_address(self):
+        self.assertEqual(self.subscriber._address, "ws://address:8080/api/explorer/v1/blocks/subscribe")
+
+        with self.assertRaises(ValueError):
+            AsyncSubscriber("address", 8080, "unknown")
+
+    def test_run(self):
+        events = ["first", "second"]
+        received = []
+
+        class WebSocketMock:
+            def __aiter__(self):
+                return self._iterate()
+
+            async def _iterate(self):
+                for event in events:
+                    yield event
+
+        async def handler(data):
+            received.append(data)
+
+        self.subscriber._ws = WebSocketMock()
+        asyncio.run(self.subscriber.run(handler))
+
+        self.assertEqual(received, events)
+
+    def test_run_not_connected(self):
+        async def handler(data):
+            pass
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.subscriber.run(handler))
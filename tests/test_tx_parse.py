@@ -2,6 +2,7 @@
 # type: ignore
 
 import copy
+import json
 import unittest
 import sys
 import os
@@ -59,6 +60,14 @@ class TestTxParse(unittest.TestCase):
         self.assertEqual(parsed_message._message_id, exonum_message._message_id)
         self.assertEqual(parsed_message.hash(), exonum_message.hash())
 
+    def test_pack_into_json(self):
+        exonum_message = self.exonum_message
+        expected_json = {"tx_body": exonum_message.signed_raw().hex()}
+
+        self.assertEqual(json.loads(exonum_message.pack_into_json()), expected_json)
+        self.assertEqual(json.loads(exonum_message.pack_into_json_bytes()), expected_json)
+        self.assertEqual(exonum_message.pack_into_json_bytes(), exonum_message.pack_into_json().encode())
+
     def test_tx_fail_parse(self):
         exonum_message = self.exonum_message
         service_name = self.cryptocurrency_service_name
@@ -1,4 +1,5 @@
 import random
+from urllib.parse import parse_qsl
 
 random.seed(0)
 
@@ -51,37 +52,79 @@ def mock_response(status_code, content=None):
     return response
 
 
-def mock_requests_get(cls_obj, url, params=None):
-    exonum_public_base = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PUBLIC_PORT)
-    _exonum_private_base = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PRIVATE_PORT)
+def text_frame(data):
+    # Unmasked websocket text frame as it is sent by a server, payloads up to 125 bytes only.
+    payload = data.encode("utf-8")
+    return bytes([0x81, len(payload)]) + payload
+
+
+# Responses which do not depend on request parameters are created once and shared between tests.
+_RESPONSE_CACHE = {
+    "proto_sources_main": proto_sources_response("main"),
+    "proto_sources_supervisor": proto_sources_response("supervisor"),
+    "ok": mock_response(200),
+}
+
+
+# Query parameters which are integers in the Exonum API; other parameters are kept as strings.
+_INT_QUERY_PARAMS = {"height", "count", "earliest", "latest"}
+
+
+def parse_query(url, params=None):
+    url, _, query = url.partition("?")
+    if query:
+        params = dict(params or {})
+        for key, value in parse_qsl(query):
+            params[key] = value
+            if key in _INT_QUERY_PARAMS:
+                try:
+                    params[key] = int(value)
+                except ValueError:
+                    pass
+
+    return url, params
 
-    proto_sources_endpoint = exonum_public_base + "api/runtimes/rust/proto-sources"
 
+_EXONUM_PUBLIC_BASE = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PUBLIC_PORT)
+_EXONUM_PRIVATE_BASE = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PRIVATE_PORT)
+
+_PROTO_SOURCES_ENDPOINT = _EXONUM_PUBLIC_BASE + "api/runtimes/rust/proto-sources"
+
+# private
+_INFO_ENDPOINT = _EXONUM_PRIVATE_BASE + SYSTEM_ENDPOINT_POSTFIX.format("info")
+_STATS_ENDPOINT = _EXONUM_PRIVATE_BASE + SYSTEM_ENDPOINT_POSTFIX.format("stats")
+_SHUTDOWN_ENDPOINT = _EXONUM_PRIVATE_BASE + SYSTEM_ENDPOINT_POSTFIX.format("shutdown")
+_CONSENSUS_ENDPOINT = _EXONUM_PRIVATE_BASE + SYSTEM_ENDPOINT_POSTFIX.format("consensus_status")
+_PEERS_ENDPOINT = _EXONUM_PRIVATE_BASE + SYSTEM_ENDPOINT_POSTFIX.format("peers")
+
+_BLOCK_ENDPOINT = _EXONUM_PUBLIC_BASE + EXPLORER_ENDPOINT_POSTFIX.format("block")
+_BLOCKS_ENDPOINT = _EXONUM_PUBLIC_BASE + EXPLORER_ENDPOINT_POSTFIX.format("blocks")
+_TRANSACTIONS_ENDPOINT = _EXONUM_PUBLIC_BASE + EXPLORER_ENDPOINT_POSTFIX.format("transactions")
+
+# Responses for the GET requests which do not depend on request parameters:
+_RESPONSES = {
+    # Proto sources endpoints.
+    # Proto sources without params (main sources):
+    (_PROTO_SOURCES_ENDPOINT, "{'type': 'core'}"): _RESPONSE_CACHE["proto_sources_main"],
+    # Proto sources for the supervisor service:
+    (
+        _PROTO_SOURCES_ENDPOINT,
+        "{'type': 'artifact', 'name': 'exonum-supervisor', 'version': '1.0.0'}",
+    ): _RESPONSE_CACHE["proto_sources_supervisor"],
+    # System endpoints:
     # private
-    info_endpoint = _exonum_private_base + SYSTEM_ENDPOINT_POSTFIX.format("info")
-    stats_endpoint = _exonum_private_base + SYSTEM_ENDPOINT_POSTFIX.format("stats")
-
-    block_endpoint = exonum_public_base + EXPLORER_ENDPOINT_POSTFIX.format("block")
-    blocks_endpoint = exonum_public_base + EXPLORER_ENDPOINT_POSTFIX.format("blocks")
-    transactions_endpoint = exonum_public_base + EXPLORER_ENDPOINT_POSTFIX.format("transactions")
-
-    responses = {
-        # Proto sources endpoints.
-        # Proto sources without params (main sources):
-        (proto_sources_endpoint, "{'type': 'core'}"): proto_sources_response("main"),
-        # Proto sources for the supervisor service:
-        (
-            proto_sources_endpoint,
-            "{'type': 'artifact', 'name': 'exonum-supervisor', 'version': '1.0.0'}",
-        ): proto_sources_response("supervisor"),
-        # System endpoints:
-        # private
-        (info_endpoint, "None"): mock_response(200),
-        (stats_endpoint, "None"): mock_response(200),
-    }
+    (_INFO_ENDPOINT, "None"): _RESPONSE_CACHE["ok"],
+    (_STATS_ENDPOINT, "None"): _RESPONSE_CACHE["ok"],
+}
+
+_POST_ENDPOINTS = {_TRANSACTIONS_ENDPOINT, _SHUTDOWN_ENDPOINT, _CONSENSUS_ENDPOINT, _PEERS_ENDPOINT}
+
+
+def mock_requests_get(cls_obj, url, params=None):
+    url, params = parse_query(url, params)
 
     # Explorer endpoints
-    if url == block_endpoint:
+    if url == _BLOCK_ENDPOINT:
         content = None
         status_code = 200
 
@@ -90,8 +133,8 @@ def mock_requests_get(cls_obj, url, params=None):
         else:
             content = {"height": params["height"]}
 
-        responses.update({(block_endpoint, str(params)): mock_response(status_code, content)})
-    if url == blocks_endpoint:
+        return mock_response(status_code, content)
+    if url == _BLOCKS_ENDPOINT:
         content = None
         status_code = 200
 
@@ -100,29 +143,19 @@ def mock_requests_get(cls_obj, url, params=None):
         elif "earliest" in params and "latest" in params and params["latest"] - params["earliest"] < 0:
             status_code = 200
 
-        responses.update({(blocks_endpoint, str(params)): mock_response(status_code, content)})
-    if url == transactions_endpoint:
+        return mock_response(status_code, content)
+    if url == _TRANSACTIONS_ENDPOINT:
         content = None
         status_code = 200
 
         if not isinstance(params["hash"], str) or not params["hash"].isalnum():
             status_code = 400
 
-        responses.update({(transactions_endpoint, str(params)): mock_response(status_code, content)})
+        return mock_response(status_code, content)
 
-    return responses[(url, str(params))]
+    return _RESPONSES[(url, str(params))]
 
 
 def mock_requests_post(cls_obj, url, data=None, headers=None):
-    exonum_public_base = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PUBLIC_PORT)
-    _exonum_private_base = EXONUM_URL_BASE.format(EXONUM_PROTO, EXONUM_IP, EXONUM_PRIVATE_PORT)
-
-    endpoints = {
-        "transactions_endpoint": exonum_public_base + EXPLORER_ENDPOINT_POSTFIX.format("transactions"),
-        "shutdown_endpoint": _exonum_private_base + SYSTEM_ENDPOINT_POSTFIX.format("shutdown"),
-        "consensus_endpoint": _exonum_private_base + SYSTEM_ENDPOINT_POSTFIX.format("consensus_status"),
-        "peers_endpoint": _exonum_private_base + SYSTEM_ENDPOINT_POSTFIX.format("peers"),
-    }
-
-    if url in endpoints.values():
-        return mock_response(200)
+    if url in _POST_ENDPOINTS:
+        return _RESPONSE_CACHE["ok"]